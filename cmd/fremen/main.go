@@ -34,6 +34,10 @@ var rootCmd = &cobra.Command{
 	RunE:  runRoot,
 }
 
+// exitCode is set by runRoot and applied by main once the command has fully
+// returned, so no os.Exit fires mid-run and skips deferred work.
+var exitCode int
+
 func init() {
 	rootCmd.Flags().BoolVarP(&flagRecursive, "recursive", "r", false, "Scan directories recursively")
 	rootCmd.Flags().BoolVarP(&flagIncludeGit, "include-git", "g", false, "Include .git directories during recursion")
@@ -59,7 +63,7 @@ func runRoot(cmd *cobra.Command, args []string) error {
 		color.NoColor = false
 	}
 	if flagNoEmoji {
-		style.NoEmoji = true
+		style.DisableEmoji()
 	}
 
 	var excludeRegex *regexp.Regexp
@@ -69,7 +73,8 @@ func runRoot(cmd *cobra.Command, args []string) error {
 			color.Red(
 				fmt.Sprintf("Invalid exclude regex: %v", err),
 			)
-			os.Exit(1)
+			exitCode = 1
+			return nil
 		}
 		excludeRegex = r
 	}
@@ -90,7 +95,8 @@ func runRoot(cmd *cobra.Command, args []string) error {
 				fmt.Sprintf("Error: %s", err),
 			)
 		}
-		os.Exit(1)
+		exitCode = 1
+		return nil
 	}
 	if !flagJSON {
 		color.Blue(
@@ -105,7 +111,8 @@ func runRoot(cmd *cobra.Command, args []string) error {
 			color.Red(
 				fmt.Sprintf("Scan error: %v", err),
 			)
-			os.Exit(1)
+			exitCode = 1
+			return nil
 		}
 		if !flagJSON {
 			color.Yellow(
@@ -115,9 +122,9 @@ func runRoot(cmd *cobra.Command, args []string) error {
 	}
 
 	if flagJSON {
-		report.PrintJSONReport(results, cfg, flagFullReport)
+		exitCode = report.PrintJSONReport(results, cfg, flagFullReport)
 	} else {
-		report.PrintCLIReport(results, cfg, flagFullReport)
+		exitCode = report.PrintCLIReport(results, cfg, flagFullReport)
 	}
 
 	return nil
@@ -128,4 +135,5 @@ func main() {
 		fmt.Fprintln(os.Stderr, err)
 		os.Exit(1)
 	}
+	os.Exit(exitCode)
 }
@@ -1,22 +1,26 @@
 package database
 
 import (
-	"bufio"
+	"bytes"
 	"errors"
 	"fmt"
 	"os"
 	"path/filepath"
-	"strings"
 )
 
+type entryKey struct {
+	name    string
+	version string
+}
+
 type VulnerabilityDatabase struct {
-	entries    map[string]map[string]struct{}
+	entries    map[entryKey]struct{}
+	names      map[string]struct{}
 	loadedPath string
-	entryCount int
 }
 
 func (db *VulnerabilityDatabase) EntryCount() int {
-	return db.entryCount
+	return len(db.entries)
 }
 
 func (db *VulnerabilityDatabase) LoadedPath() string {
@@ -25,7 +29,8 @@ func (db *VulnerabilityDatabase) LoadedPath() string {
 
 func New() *VulnerabilityDatabase {
 	return &VulnerabilityDatabase{
-		entries: make(map[string]map[string]struct{}),
+		entries: make(map[entryKey]struct{}),
+		names:   make(map[string]struct{}),
 	}
 }
 
@@ -45,23 +50,30 @@ func (db *VulnerabilityDatabase) Load(path string) error {
 		return nil
 	}
 
-	file, err := os.Open(path)
+	data, err := os.ReadFile(path)
 	if err != nil {
 		if errors.Is(err, os.ErrNotExist) {
 			return fmt.Errorf("database not found at %q; please provide a valid path using --database or ensure database.txt exists", path)
 		}
 		return fmt.Errorf("failed to open database: %w", err)
 	}
-	defer func() { _ = file.Close() }()
 
-	newEntries := make(map[string]map[string]struct{})
-	count := 0
+	newEntries := make(map[entryKey]struct{})
+	newNames := make(map[string]struct{})
 
-	scanner := bufio.NewScanner(file)
-	for scanner.Scan() {
-		line := strings.TrimSpace(scanner.Text())
+	// Scan the raw bytes directly; only the kept name/version tokens are
+	// converted to strings, so skipped lines cost no allocation.
+	for len(data) > 0 {
+		line := data
+		if nl := bytes.IndexByte(data, '\n'); nl != -1 {
+			line = data[:nl]
+			data = data[nl+1:]
+		} else {
+			data = nil
+		}
 
-		if line == "" || strings.HasPrefix(line, "#") {
+		line = bytes.TrimSpace(line)
+		if len(line) == 0 || line[0] == '#' {
 			continue
 		}
 
@@ -70,56 +82,53 @@ func (db *VulnerabilityDatabase) Load(path string) error {
 			continue
 		}
 
-		versions := newEntries[name]
-		if versions == nil {
-			versions = make(map[string]struct{})
-			newEntries[name] = versions
-		}
-
-		if _, exists := versions[version]; !exists {
-			versions[version] = struct{}{}
-			count++
-		}
-	}
-
-	if err := scanner.Err(); err != nil {
-		return fmt.Errorf("error while reading database: %w", err)
+		newEntries[entryKey{name: name, version: version}] = struct{}{}
+		newNames[name] = struct{}{}
 	}
 
 	db.entries = newEntries
+	db.names = newNames
 	db.loadedPath = path
-	db.entryCount = count
 
 	return nil
 }
 
+// HasPackage reports whether any version of the given package appears in the
+// database. Parsers can use it to skip per-entry work for the overwhelming
+// majority of packages the database has never heard of.
+func (db *VulnerabilityDatabase) HasPackage(name string) bool {
+	_, ok := db.names[name]
+	return ok
+}
+
 func (db *VulnerabilityDatabase) IsInfected(name, version string) bool {
 	if name == "" || version == "" {
 		return false
 	}
 
-	versions := db.entries[name]
-	if versions == nil {
+	// Almost every lookup is for a clean package, so reject unknown names
+	// with a single string hash before probing the full entry set.
+	if _, known := db.names[name]; !known {
 		return false
 	}
 
-	_, found := versions[version]
+	_, found := db.entries[entryKey{name: name, version: version}]
 	return found
 }
 
 // Parses a line of "name:version" and returns name, version, ok.
-func parseEntry(line string) (name, version string, ok bool) {
-	idx := strings.IndexByte(line, ':')
+func parseEntry(line []byte) (name, version string, ok bool) {
+	idx := bytes.IndexByte(line, ':')
 	if idx <= 0 || idx >= len(line)-1 {
 		return "", "", false
 	}
 
-	name = strings.TrimSpace(line[:idx])
-	version = strings.TrimSpace(line[idx+1:])
+	nameBytes := bytes.TrimSpace(line[:idx])
+	versionBytes := bytes.TrimSpace(line[idx+1:])
 
-	if name == "" || version == "" {
+	if len(nameBytes) == 0 || len(versionBytes) == 0 {
 		return "", "", false
 	}
 
-	return name, version, true
+	return string(nameBytes), string(versionBytes), true
 }
@@ -2,62 +2,109 @@ package parser
 
 import (
 	"encoding/json"
-	"os"
+	"fmt"
+	"io"
 	"path/filepath"
 	"strings"
 
 	"github.com/MrSquaare/fremen/internal/database"
 )
 
-type npmLockfile struct {
-	Dependencies map[string]npmPkg `json:"dependencies"`
-	Packages     map[string]npmPkg `json:"packages"`
-}
-
 type npmPkg struct {
 	Version string `json:"version"`
 }
 
 // Parses npm lockfiles (both legacy and v2/v3 formats) and returns all packages flagged as vulnerable by the DB.
-func parseNpmLockfile(path string, db *database.VulnerabilityDatabase) ([]Vulnerability, error) {
-	data, err := os.ReadFile(path)
+//
+// The lockfile is streamed token by token: only the `dependencies` and
+// `packages` sections are decoded, one entry at a time, so the full object
+// graph of a large lockfile is never materialized in memory.
+func parseNpmLockfile(r io.Reader, db *database.VulnerabilityDatabase) ([]Vulnerability, error) {
+	dec := json.NewDecoder(r)
+
+	tok, err := dec.Token()
 	if err != nil {
 		return nil, err
 	}
-
-	var lf npmLockfile
-	if err := json.Unmarshal(data, &lf); err != nil {
-		return nil, err
+	if d, ok := tok.(json.Delim); !ok || d != '{' {
+		return nil, fmt.Errorf("invalid lockfile: expected top-level object")
 	}
 
 	var vulns []Vulnerability
 
-	// Legacy `dependencies`
-	for name, pkg := range lf.Dependencies {
-		if isVulnerable(db, name, pkg.Version) {
-			vulns = append(vulns, Vulnerability{
-				PackageName: name,
-				Version:     pkg.Version,
-			})
+	for dec.More() {
+		keyTok, err := dec.Token()
+		if err != nil {
+			return nil, err
+		}
+		key, _ := keyTok.(string)
+
+		switch key {
+		// Legacy `dependencies` and modern npm v2/v3 `packages` sections
+		case "dependencies", "packages":
+			if err := streamNpmSection(dec, key == "packages", db, &vulns); err != nil {
+				return nil, err
+			}
+		default:
+			var skipped json.RawMessage
+			if err := dec.Decode(&skipped); err != nil {
+				return nil, err
+			}
 		}
 	}
 
-	// Modern npm v2/v3 `packages` section
-	for pkgPath, pkg := range lf.Packages {
-		if pkgPath == "" {
-			continue
+	if _, err := dec.Token(); err != nil {
+		return nil, err
+	}
+
+	return vulns, nil
+}
+
+// streamNpmSection consumes one dependency section object, checking each
+// entry against the database as soon as it is decoded.
+func streamNpmSection(dec *json.Decoder, isPackages bool, db *database.VulnerabilityDatabase, vulns *[]Vulnerability) error {
+	tok, err := dec.Token()
+	if err != nil {
+		return err
+	}
+	if tok == nil {
+		// An explicit null section holds no packages.
+		return nil
+	}
+	if d, ok := tok.(json.Delim); !ok || d != '{' {
+		return fmt.Errorf("invalid lockfile: dependency section is not an object")
+	}
+
+	for dec.More() {
+		keyTok, err := dec.Token()
+		if err != nil {
+			return err
+		}
+		key, _ := keyTok.(string)
+
+		var pkg npmPkg
+		if err := dec.Decode(&pkg); err != nil {
+			return err
+		}
+
+		name := key
+		if isPackages {
+			if key == "" {
+				continue
+			}
+			name = npmPackageName(key)
 		}
 
-		name := npmPackageName(pkgPath)
 		if isVulnerable(db, name, pkg.Version) {
-			vulns = append(vulns, Vulnerability{
+			*vulns = append(*vulns, Vulnerability{
 				PackageName: name,
 				Version:     pkg.Version,
 			})
 		}
 	}
 
-	return vulns, nil
+	_, err = dec.Token()
+	return err
 }
 
 func npmPackageName(path string) string {
@@ -1,6 +1,8 @@
 package parser
 
 import (
+	"io"
+
 	"github.com/MrSquaare/fremen/internal/database"
 )
 
@@ -9,7 +11,10 @@ type Vulnerability struct {
 	Version     string `json:"version"`
 }
 
-type LockfileParserFunc func(path string, db *database.VulnerabilityDatabase) ([]Vulnerability, error)
+// LockfileParserFunc consumes an already-open lockfile stream. The caller
+// owns the file handle, so a lockfile is opened exactly once per scan and
+// parsers stay free of path handling.
+type LockfileParserFunc func(r io.Reader, db *database.VulnerabilityDatabase) ([]Vulnerability, error)
 
 var LockfileParsers = map[string]LockfileParserFunc{
 	"package-lock.json": parseNpmLockfile,
@@ -2,8 +2,7 @@ package parser
 
 import (
 	"bufio"
-	"os"
-	"regexp"
+	"io"
 	"strings"
 
 	"github.com/MrSquaare/fremen/internal/database"
@@ -32,43 +31,48 @@ var (
 		"specifiers":                 {},
 		"patchedDependencies":        {},
 	}
-
-	pnpmKeyPattern = regexp.MustCompile(`^\s+['"]?/?([^:'"\s]+)['"]?:`)
 )
 
 // Parse pnpm lockfile for vulnerable packages and and returns all packages flagged as vulnerable by the DB.
-func parsePnpmLockfile(path string, db *database.VulnerabilityDatabase) ([]Vulnerability, error) {
-	f, err := os.Open(path)
-	if err != nil {
-		return nil, err
-	}
-	defer func() { _ = f.Close() }()
-
+func parsePnpmLockfile(r io.Reader, db *database.VulnerabilityDatabase) ([]Vulnerability, error) {
 	var issues []Vulnerability
-	sc := bufio.NewScanner(f)
+	sc := bufio.NewScanner(r)
+
+	// Transitive packages repeat under many sections of real lockfiles, so
+	// coordinate extraction is memoized for the duration of this file.
+	coordsCache := make(map[string]pnpmCoords)
 
 	for sc.Scan() {
 		line := sc.Text()
 
-		m := pnpmKeyPattern.FindStringSubmatch(line)
-		if len(m) < 2 {
+		// Cheap reject: entry keys only live on indented lines, so skip
+		// top-level and blank lines before any per-byte scanning.
+		if line == "" || (line[0] != ' ' && line[0] != '\t') {
+			continue
+		}
+
+		key, ok := pnpmEntryKey(line)
+		if !ok {
 			continue
 		}
-		key := m[1]
 
 		if _, skip := pnpmIgnoredKeys[key]; skip {
 			continue
 		}
 
-		name, version, ok := parsePnpmKey(key)
-		if !ok {
+		coords, cached := coordsCache[key]
+		if !cached {
+			coords.name, coords.version, coords.ok = parsePnpmKey(key)
+			coordsCache[key] = coords
+		}
+		if !coords.ok {
 			continue
 		}
 
-		if db.IsInfected(name, version) {
+		if db.IsInfected(coords.name, coords.version) {
 			issues = append(issues, Vulnerability{
-				PackageName: name,
-				Version:     version,
+				PackageName: coords.name,
+				Version:     coords.version,
 			})
 		}
 	}
@@ -79,6 +83,58 @@ func parsePnpmLockfile(path string, db *database.VulnerabilityDatabase) ([]Vulne
 	return issues, nil
 }
 
+// pnpmEntryKey extracts the map key from an indented `key:` line, matching
+// the same shapes the former `^[ \t]+['"]?/?([^:'"\s]+)['"]?:` pattern did
+// (optional quoting, optional leading slash) with plain byte scanning.
+func pnpmEntryKey(line string) (string, bool) {
+	i := 0
+	for i < len(line) && (line[i] == ' ' || line[i] == '\t') {
+		i++
+	}
+	if i == len(line) {
+		return "", false
+	}
+
+	if line[i] == '\'' || line[i] == '"' {
+		i++
+	}
+	if i < len(line) && line[i] == '/' {
+		i++
+	}
+
+	start := i
+	for i < len(line) {
+		c := line[i]
+		if c == ':' || c == '\'' || c == '"' || c == ' ' || c == '\t' {
+			break
+		}
+		i++
+	}
+	if i == start || i == len(line) {
+		return "", false
+	}
+
+	key := line[start:i]
+	if line[i] == '\'' || line[i] == '"' {
+		i++
+		if i == len(line) {
+			return "", false
+		}
+	}
+	if line[i] != ':' {
+		return "", false
+	}
+
+	return key, true
+}
+
+// pnpmCoords caches the outcome of parsePnpmKey for one lockfile pass.
+type pnpmCoords struct {
+	name    string
+	version string
+	ok      bool
+}
+
 func parsePnpmKey(key string) (name, version string, ok bool) {
 	if idx := strings.Index(key, "("); idx != -1 {
 		key = key[:idx]
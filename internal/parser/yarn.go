@@ -1,41 +1,118 @@
 package parser
 
 import (
-	"os"
-	"regexp"
+	"bufio"
+	"io"
+	"strings"
 
 	"github.com/MrSquaare/fremen/internal/database"
 )
 
-var yarnPattern = regexp.MustCompile(
-	`(?m)^['"]?(@?[^@"\s']+)@.+?['"]?:\s*(?:\r?\n|\r)\s*version(?:\s+|:\s+)["']?([^"\s']+)["']?`,
-)
-
 // Parses a Yarn v1 lockfile and returns all packages flagged as vulnerable by the DB.
-func parseYarnLockfile(path string, db *database.VulnerabilityDatabase) ([]Vulnerability, error) {
-	data, err := os.ReadFile(path)
-	if err != nil {
-		return nil, err
-	}
-
+//
+// The file is scanned line by line: a non-indented line ending in ":" opens an
+// entry header, and the first indented line after it must carry the version
+// (covering both classic `version "x"` and berry `version: x` forms). This
+// streams the file in constant memory instead of buffering it for a multiline
+// regex pass.
+func parseYarnLockfile(r io.Reader, db *database.VulnerabilityDatabase) ([]Vulnerability, error) {
 	var issues []Vulnerability
+	sc := bufio.NewScanner(r)
 
-	matches := yarnPattern.FindAllSubmatch(data, -1)
-	for _, m := range matches {
-		if len(m) < 3 {
+	pending := ""
+
+	for sc.Scan() {
+		line := sc.Text()
+		trimmed := strings.TrimSpace(line)
+
+		if trimmed == "" {
 			continue
 		}
 
-		pkg := string(m[1])
-		ver := string(m[2])
+		if line[0] != ' ' && line[0] != '\t' {
+			// Top-level line: a new entry header, or noise such as comments.
+			// Headers whose package the database has never heard of are
+			// dropped immediately so their version line is never parsed.
+			pending = ""
+			if trimmed[0] != '#' {
+				if name := yarnHeaderName(trimmed); db.HasPackage(name) {
+					pending = name
+				}
+			}
+			continue
+		}
 
-		if db.IsInfected(pkg, ver) {
-			issues = append(issues, Vulnerability{
-				PackageName: pkg,
-				Version:     ver,
-			})
+		// The first indented line after a header decides the entry version.
+		if pending != "" {
+			if ver, ok := yarnVersion(trimmed); ok && db.IsInfected(pending, ver) {
+				issues = append(issues, Vulnerability{
+					PackageName: pending,
+					Version:     ver,
+				})
+			}
+			pending = ""
 		}
 	}
 
+	if err := sc.Err(); err != nil {
+		return issues, err
+	}
 	return issues, nil
 }
+
+// yarnHeaderName extracts the package name from an entry header such as
+// `"@scope/pkg@^1.0.0":` or `pkg@npm:^1.0.0, pkg@^1.0.1:`. Returns "" when
+// the line is not a valid header.
+func yarnHeaderName(header string) string {
+	if !strings.HasSuffix(header, ":") {
+		return ""
+	}
+
+	if header[0] == '"' || header[0] == '\'' {
+		header = header[1:]
+	}
+
+	start := 0
+	if strings.HasPrefix(header, "@") {
+		start = 1
+	}
+
+	// The "@" separating name from spec must leave at least one spec
+	// character before the trailing ":".
+	sep := strings.IndexByte(header[start:], '@')
+	if sep <= 0 || start+sep >= len(header)-2 {
+		return ""
+	}
+
+	name := header[:start+sep]
+	if strings.ContainsAny(name, "\"' \t") {
+		return ""
+	}
+	return name
+}
+
+// yarnVersion extracts the version from a `version "1.0.0"` or
+// `version: 1.0.0` line.
+func yarnVersion(line string) (string, bool) {
+	rest, ok := strings.CutPrefix(line, "version")
+	if !ok || rest == "" {
+		return "", false
+	}
+
+	if rest[0] == ':' {
+		rest = rest[1:]
+	}
+	if rest == "" || (rest[0] != ' ' && rest[0] != '\t') {
+		return "", false
+	}
+
+	rest = strings.TrimLeft(rest, " \t")
+	if rest != "" && (rest[0] == '"' || rest[0] == '\'') {
+		rest = rest[1:]
+	}
+	if end := strings.IndexAny(rest, "\"' \t"); end != -1 {
+		rest = rest[:end]
+	}
+
+	return rest, rest != ""
+}
@@ -5,6 +5,7 @@ import (
 	"fmt"
 	"os"
 
+	"github.com/MrSquaare/fremen/internal/parser"
 	"github.com/MrSquaare/fremen/internal/scanner"
 )
 
@@ -18,7 +19,24 @@ type JSONConfig struct {
 	FullReport         bool     `json:"full_report"`
 }
 
-func PrintJSONReport(results []scanner.ScanResult, cfg scanner.ScanConfig, showFull bool) {
+// JSONResult mirrors one scan result in the serialized report. Fields are
+// declared in the key order the former map-based output produced.
+type JSONResult struct {
+	InfectedCount    int                    `json:"infected_count"`
+	InfectedPackages []parser.Vulnerability `json:"infected_packages"`
+	Lockfiles        []string               `json:"lockfiles"`
+	Project          string                 `json:"project"`
+}
+
+type JSONReport struct {
+	Configuration JSONConfig   `json:"configuration"`
+	Results       []JSONResult `json:"results"`
+	Summary       Summary      `json:"summary"`
+}
+
+// PrintJSONReport writes the JSON report to stdout and returns the process
+// exit code, leaving the actual os.Exit to the caller.
+func PrintJSONReport(results []scanner.ScanResult, cfg scanner.ScanConfig, showFull bool) int {
 	dbPath := cfg.DatabasePath
 	if dbPath == "" {
 		dbPath = "Default"
@@ -40,29 +58,33 @@ func PrintJSONReport(results []scanner.ScanResult, cfg scanner.ScanConfig, showF
 
 	displayResults, summary := summarizeScanResults(results, jsonCfg.FullReport)
 
-	outResults := make([]map[string]any, 0, len(displayResults))
+	outResults := make([]JSONResult, 0, len(displayResults))
 	for _, r := range displayResults {
-		outResults = append(outResults, r.ToMap())
+		outResults = append(outResults, JSONResult{
+			InfectedCount:    r.InfectedCount(),
+			InfectedPackages: r.InfectedPackages,
+			Lockfiles:        r.Lockfiles,
+			Project:          r.ProjectPath,
+		})
 	}
 
-	out := map[string]any{
-		"configuration": jsonCfg,
-		"results":       outResults,
-		"summary":       summary,
+	out := JSONReport{
+		Configuration: jsonCfg,
+		Results:       outResults,
+		Summary:       summary,
 	}
 
 	enc := json.NewEncoder(os.Stdout)
 	enc.SetIndent("", "  ")
 	if err := enc.Encode(out); err != nil {
 		fmt.Fprintln(os.Stderr, "Error encoding JSON:", err)
-		os.Exit(1)
+		return 1
 	}
 
 	if summary.TotalProjects == 0 {
-		os.Exit(1)
+		return 1
 	} else if summary.InfectedProjects > 0 {
-		os.Exit(1)
-	} else {
-		os.Exit(0)
+		return 1
 	}
+	return 0
 }
@@ -2,7 +2,6 @@ package report
 
 import (
 	"fmt"
-	"os"
 	"strings"
 
 	"github.com/MrSquaare/fremen/internal/scanner"
@@ -41,7 +40,9 @@ func stringOrDash(s string) string {
 	return s
 }
 
-func PrintCLIReport(results []scanner.ScanResult, cfg scanner.ScanConfig, showFull bool) {
+// PrintCLIReport writes the human-readable report to stdout and returns the
+// process exit code, leaving the actual os.Exit to the caller.
+func PrintCLIReport(results []scanner.ScanResult, cfg scanner.ScanConfig, showFull bool) int {
 	dbPath := cfg.DatabasePath
 	if dbPath == "" {
 		dbPath = "Default"
@@ -78,22 +79,29 @@ func PrintCLIReport(results []scanner.ScanResult, cfg scanner.ScanConfig, showFu
 	color.Blue(style.EmojiText("🚀", "Project Reports"))
 	color.Blue("──────────────────")
 
+	// Resolve the repeated tags and labels once; only the per-project
+	// values change inside the loop.
+	infectedFormat := style.EmojiText("🚫", "[INFECTED] %s")
+	cleanFormat := style.EmojiText("✅", "[CLEAN]    %s")
+	lockfilesLabel := style.EmojiText("📄", "Lockfiles:")
+	packagesLabel := style.EmojiText("🦠", "Infected Packages:")
+
 	for _, r := range displayResults {
 		count := r.InfectedCount()
 		if count > 0 {
 			fmt.Println()
 			color.Red(
-				style.EmojiText("🚫", fmt.Sprintf("[INFECTED] %s", r.ProjectPath)),
+				fmt.Sprintf(infectedFormat, r.ProjectPath),
 			)
-			fmt.Printf("   %s %s\n", style.EmojiText("📄", "Lockfiles:"), strings.Join(r.Lockfiles, ", "))
-			fmt.Printf("   %s %d\n", style.EmojiText("🦠", "Infected Packages:"), count)
+			fmt.Printf("   %s %s\n", lockfilesLabel, strings.Join(r.Lockfiles, ", "))
+			fmt.Printf("   %s %d\n", packagesLabel, count)
 			for _, v := range r.InfectedPackages {
 				fmt.Printf("      - %s@%s\n", v.PackageName, v.Version)
 			}
 		} else {
 			fmt.Println()
 			color.Blue(
-				style.EmojiText("✅", fmt.Sprintf("[CLEAN]    %s", r.ProjectPath)),
+				fmt.Sprintf(cleanFormat, r.ProjectPath),
 			)
 		}
 	}
@@ -110,16 +118,16 @@ func PrintCLIReport(results []scanner.ScanResult, cfg scanner.ScanConfig, showFu
 
 	if summary.TotalProjects == 0 {
 		color.Yellow(style.EmojiText("⚠️", "No lockfile found"))
-		os.Exit(1)
+		return 1
 	} else if summary.InfectedProjects == 0 {
 		color.Green(
 			style.EmojiText("🎉", "No project infected. You are safe!"),
 		)
-		os.Exit(0)
-	} else {
-		color.Red(
-			style.EmojiText("❌", fmt.Sprintf("Found %d infected projects!", summary.InfectedProjects)),
-		)
-		os.Exit(1)
+		return 0
 	}
+
+	color.Red(
+		style.EmojiText("❌", fmt.Sprintf("Found %d infected projects!", summary.InfectedProjects)),
+	)
+	return 1
 }
@@ -3,7 +3,6 @@ package scanner
 import (
 	"errors"
 	"fmt"
-	"io/fs"
 	"os"
 	"path/filepath"
 	"regexp"
@@ -28,15 +27,17 @@ type ScanConfig struct {
 	ExcludeRegex *regexp.Regexp
 }
 
+// scanTask covers every lockfile detected in one directory, so a project
+// costs a single queue round-trip no matter how many lockfiles it holds.
 type scanTask struct {
-	Dir      string
-	Lockfile string
+	Dir       string
+	Lockfiles []string
 }
 
 type scanResultItem struct {
-	Dir      string
-	Lockfile string
-	Issues   []parser.Vulnerability
+	Dir       string
+	Lockfiles []string
+	Issues    []parser.Vulnerability
 }
 
 type projectEntry struct {
@@ -46,25 +47,31 @@ type projectEntry struct {
 
 // ExecuteScan scans all target paths concurrently and aggregates results.
 func ExecuteScan(cfg ScanConfig, db *database.VulnerabilityDatabase) ([]ScanResult, error) {
-	// 1. collect tasks concurrently
-	var tasks []scanTask
-	var errs []error
-	for _, p := range cfg.TargetPaths {
-		found, err := collectTasksForPath(cfg, p)
-		if err != nil {
-			errs = append(errs, err)
-		}
-		tasks = append(tasks, found...)
-	}
+	workers := workerCount()
+	// Buffered channels act as small bounded queues: the feeder can stay a
+	// few tasks ahead and workers never block on an unbuffered handoff with
+	// the aggregator, while backpressure still caps in-flight work.
+	jobs := make(chan scanTask, workers)
+	jobResults := make(chan scanResultItem, workers)
 
-	if len(tasks) == 0 {
-		return nil, errors.Join(errs...)
+	var errs []error
+	var errsMu sync.Mutex
+	appendErr := func(err error) {
+		errsMu.Lock()
+		errs = append(errs, err)
+		errsMu.Unlock()
 	}
 
-	workers := workerCount()
-	jobs := make(chan scanTask)
-	jobResults := make(chan scanResultItem)
-	var errsMu sync.Mutex
+	// 1. produce tasks while walking, so parsing overlaps directory I/O
+	// instead of waiting for the whole tree to be enumerated first
+	go func() {
+		for _, p := range cfg.TargetPaths {
+			if err := collectTasksForPath(cfg, p, jobs); err != nil {
+				appendErr(err)
+			}
+		}
+		close(jobs)
+	}()
 
 	var wg sync.WaitGroup
 	wg.Add(workers)
@@ -73,36 +80,46 @@ func ExecuteScan(cfg ScanConfig, db *database.VulnerabilityDatabase) ([]ScanResu
 		go func() {
 			defer wg.Done()
 			for job := range jobs {
-				parserFn, ok := parser.LockfileParsers[job.Lockfile]
-				if !ok {
-					continue
+				parsed := make([]string, 0, len(job.Lockfiles))
+				var issues []parser.Vulnerability
+
+				for _, lockfile := range job.Lockfiles {
+					parserFn, ok := parser.LockfileParsers[lockfile]
+					if !ok {
+						continue
+					}
+
+					fullPath := filepath.Join(job.Dir, lockfile)
+					f, err := os.Open(fullPath)
+					if err != nil {
+						appendErr(fmt.Errorf("parse %s: %w", fullPath, err))
+						continue
+					}
+
+					found, err := parserFn(f, db)
+					_ = f.Close()
+					if err != nil {
+						appendErr(fmt.Errorf("parse %s: %w", fullPath, err))
+						continue
+					}
+
+					parsed = append(parsed, lockfile)
+					issues = append(issues, found...)
 				}
 
-				fullPath := filepath.Join(job.Dir, job.Lockfile)
-				issues, err := parserFn(fullPath, db)
-				if err != nil {
-					errsMu.Lock()
-					errs = append(errs, fmt.Errorf("parse %s: %w", fullPath, err))
-					errsMu.Unlock()
+				if len(parsed) == 0 {
 					continue
 				}
 
 				jobResults <- scanResultItem{
-					Dir:      job.Dir,
-					Lockfile: job.Lockfile,
-					Issues:   issues,
+					Dir:       job.Dir,
+					Lockfiles: parsed,
+					Issues:    issues,
 				}
 			}
 		}()
 	}
 
-	go func() {
-		for _, t := range tasks {
-			jobs <- t
-		}
-		close(jobs)
-	}()
-
 	go func() {
 		wg.Wait()
 		close(jobResults)
@@ -120,8 +137,10 @@ func ExecuteScan(cfg ScanConfig, db *database.VulnerabilityDatabase) ([]ScanResu
 			projects = append(projects, jobResult.Dir)
 		}
 
-		if !slices.Contains(entry.Lockfiles, jobResult.Lockfile) {
-			entry.Lockfiles = append(entry.Lockfiles, jobResult.Lockfile)
+		for _, lockfile := range jobResult.Lockfiles {
+			if !slices.Contains(entry.Lockfiles, lockfile) {
+				entry.Lockfiles = append(entry.Lockfiles, lockfile)
+			}
 		}
 
 		if len(jobResult.Issues) > 0 {
@@ -152,117 +171,151 @@ func isLockfile(name string) bool {
 	return ok
 }
 
-func isExcludedDir(cfg ScanConfig, dirName string) bool {
-	if !cfg.IncludeNodeModules && strings.EqualFold(dirName, "node_modules") {
-		return true
+// skipDirNames builds the set of lowercased directory names excluded by the
+// configuration, computed once per walk instead of re-deriving it per entry.
+func skipDirNames(cfg ScanConfig) map[string]struct{} {
+	skip := make(map[string]struct{}, 2)
+	if !cfg.IncludeNodeModules {
+		skip["node_modules"] = struct{}{}
 	}
-	if !cfg.IncludeGit && strings.EqualFold(dirName, ".git") {
-		return true
+	if !cfg.IncludeGit {
+		skip[".git"] = struct{}{}
 	}
-	return false
+	return skip
+}
+
+func isSkippedDir(skip map[string]struct{}, dirName string) bool {
+	if len(skip) == 0 {
+		return false
+	}
+	_, ok := skip[strings.ToLower(dirName)]
+	return ok
 }
 
 func workerCount() int {
 	const minWorkers = 4
 
-	n := runtime.NumCPU()
+	// GOMAXPROCS reflects the parallelism actually available to the
+	// scheduler (CPU quotas, GOMAXPROCS overrides), unlike the raw CPU
+	// count, so CPU-bound parsing scales without oversubscribing.
+	n := runtime.GOMAXPROCS(0)
 	if n < minWorkers {
 		return minWorkers
 	}
 	return n
 }
 
-// collectTasksForPath finds lockfiles at or under a given input path.
-func collectTasksForPath(cfg ScanConfig, path string) ([]scanTask, error) {
+// collectTasksForPath finds lockfiles at or under a given input path,
+// streaming each task into the jobs channel as soon as it is discovered.
+func collectTasksForPath(cfg ScanConfig, path string, jobs chan<- scanTask) error {
 	abs, err := filepath.Abs(path)
 	if err != nil {
-		return nil, fmt.Errorf("resolve path %q: %w", path, err)
+		return fmt.Errorf("resolve path %q: %w", path, err)
 	}
 
 	info, err := os.Stat(abs)
 	if err != nil {
-		return nil, fmt.Errorf("stat %q: %w", abs, err)
+		return fmt.Errorf("stat %q: %w", abs, err)
 	}
 
 	if !info.IsDir() {
 		name := filepath.Base(abs)
 		if isLockfile(name) {
-			return []scanTask{{
-				Dir:      filepath.Dir(abs),
-				Lockfile: name,
-			}}, nil
+			jobs <- scanTask{
+				Dir:       filepath.Dir(abs),
+				Lockfiles: []string{name},
+			}
 		}
-		return nil, nil
+		return nil
 	}
 
-	base := abs
-	tasks := make([]scanTask, 0)
+	return walkForTasks(cfg, abs, jobs)
+}
+
+// walkForTasks traverses a directory tree with an explicit stack, reading
+// entries in directory order and pruning skipped directories before ever
+// descending into them. The type information cached by readdir is enough to
+// route every entry, so no per-entry stat calls are issued.
+func walkForTasks(cfg ScanConfig, base string, jobs chan<- scanTask) error {
+	// Hoist the per-entry invariants once instead of re-reading the config
+	// for every directory and file visited.
+	exclude := cfg.ExcludeRegex
+	recursive := cfg.Recursive
+	skip := skipDirNames(cfg)
+
+	if exclude != nil && exclude.MatchString(base) {
+		return nil
+	}
+	if isSkippedDir(skip, filepath.Base(base)) {
+		return nil
+	}
 
 	walkErrors := []error{}
+	stack := []string{base}
+
+	for len(stack) > 0 {
+		dir := stack[len(stack)-1]
+		stack = stack[:len(stack)-1]
 
-	err = filepath.WalkDir(base, func(path string, d fs.DirEntry, walkErr error) error {
-		if walkErr != nil {
-			walkErrors = append(walkErrors, fmt.Errorf("walk %q: %w", base, walkErr))
-			return nil
+		f, err := os.Open(dir)
+		if err != nil {
+			walkErrors = append(walkErrors, fmt.Errorf("walk %q: %w", base, err))
+			continue
 		}
 
-		if cfg.ExcludeRegex != nil && cfg.ExcludeRegex.MatchString(path) {
-			if d.IsDir() {
-				return filepath.SkipDir
-			}
-			return nil
+		entries, err := f.ReadDir(-1)
+		_ = f.Close()
+		if err != nil {
+			walkErrors = append(walkErrors, fmt.Errorf("walk %q: %w", base, err))
 		}
 
-		if d.IsDir() {
-			if path != base && !cfg.Recursive {
-				return filepath.SkipDir
+		var lockfiles []string
+		for _, entry := range entries {
+			name := entry.Name()
+			path := filepath.Join(dir, name)
+
+			if exclude != nil && exclude.MatchString(path) {
+				continue
 			}
-			if isExcludedDir(cfg, d.Name()) {
-				return filepath.SkipDir
+
+			if entry.IsDir() {
+				if recursive && !isSkippedDir(skip, name) {
+					stack = append(stack, path)
+				}
+				continue
 			}
-			return nil
-		}
 
-		if isLockfile(d.Name()) {
-			tasks = append(tasks, scanTask{
-				Dir:      filepath.Dir(path),
-				Lockfile: d.Name(),
-			})
+			if isLockfile(name) {
+				lockfiles = append(lockfiles, name)
+			}
 		}
 
-		return nil
-	})
-
-	if err != nil {
-		return nil, err
+		if len(lockfiles) > 0 {
+			jobs <- scanTask{
+				Dir:       dir,
+				Lockfiles: lockfiles,
+			}
+		}
 	}
 
 	if len(walkErrors) > 0 {
-		return tasks, errors.Join(walkErrors...)
+		return errors.Join(walkErrors...)
 	}
 
-	return tasks, nil
-}
-
-type vulnerabilityKey struct {
-	Name    string
-	Version string
+	return nil
 }
 
 func deduplicateVulnerabilities(items []parser.Vulnerability) []parser.Vulnerability {
-	seen := make(map[vulnerabilityKey]struct{}, len(items))
+	// Vulnerability is a comparable two-string struct, so it can key the
+	// seen set directly without building a parallel key type per item.
+	seen := make(map[parser.Vulnerability]struct{}, len(items))
 	out := make([]parser.Vulnerability, 0, len(items))
 
 	for _, v := range items {
-		key := vulnerabilityKey{
-			Name:    v.PackageName,
-			Version: v.Version,
-		}
-
-		if _, ok := seen[key]; ok {
+		if _, ok := seen[v]; ok {
 			continue
 		}
-		seen[key] = struct{}{}
+		seen[v] = struct{}{}
 		out = append(out, v)
 	}
 
@@ -1,10 +1,19 @@
 package style
 
-var NoEmoji = false
+// EmojiText renders a label with its emoji prefix. The implementation is
+// bound once at startup (see DisableEmoji), so report loops pay no per-call
+// preference branch.
+var EmojiText = emojiText
 
-func EmojiText(symbol, text string) string {
-	if NoEmoji {
-		return text
-	}
+func emojiText(symbol, text string) string {
 	return symbol + " " + text
 }
+
+func plainText(_, text string) string {
+	return text
+}
+
+// DisableEmoji rebinds EmojiText to plain text rendering.
+func DisableEmoji() {
+	EmojiText = plainText
+}
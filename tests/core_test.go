@@ -6,7 +6,7 @@ import (
 )
 
 func (s *FremenTestSuite) Test_Core_CustomDatabase() {
-	target := filepath.Join(s.fixturesDir, "cases", "features", "custom_database")
+	target := filepath.Join(s.casesDir, "features", "custom_database")
 	customDb := filepath.Join(target, "custom-database.txt")
 
 	report, exitCode := s.runFremenJSON(target, "--database", customDb)
@@ -43,7 +43,7 @@ func (s *FremenTestSuite) Test_Core_CustomDatabase() {
 }
 
 func (s *FremenTestSuite) Test_Core_FullReport() {
-	target := filepath.Join(s.fixturesDir, "cases", "features", "full_report")
+	target := filepath.Join(s.casesDir, "features", "full_report")
 	report, exitCode := s.runFremenJSON(target, "-f")
 	s.Equal(0, exitCode)
 
@@ -76,7 +76,7 @@ func (s *FremenTestSuite) Test_Core_FullReport() {
 }
 
 func (s *FremenTestSuite) Test_Core_JSONValidity() {
-	target := filepath.Join(s.fixturesDir, "cases", "npm", "v1_infected")
+	target := filepath.Join(s.casesDir, "npm", "v1_infected")
 	output, _ := s.runFremen(target, "--json")
 
 	var js map[string]interface{}
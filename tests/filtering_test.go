@@ -6,7 +6,7 @@ import (
 )
 
 func (s *FremenTestSuite) Test_Filtering_IgnoreDefaults() {
-	target := filepath.Join(s.fixturesDir, "cases", "filtering")
+	target := filepath.Join(s.casesDir, "filtering")
 	report, exitCode := s.runFremenJSON(target, "--recursive")
 
 	s.Equal(1, exitCode)
@@ -18,7 +18,7 @@ func (s *FremenTestSuite) Test_Filtering_IgnoreDefaults() {
 }
 
 func (s *FremenTestSuite) Test_Filtering_IncludeGit() {
-	target := filepath.Join(s.fixturesDir, "cases", "filtering")
+	target := filepath.Join(s.casesDir, "filtering")
 	report, exitCode := s.runFremenJSON(target, "--recursive", "--include-git")
 	s.Equal(1, exitCode)
 
@@ -32,14 +32,14 @@ func (s *FremenTestSuite) Test_Filtering_IncludeGit() {
 }
 
 func (s *FremenTestSuite) Test_Filtering_IncludeNodeModules() {
-	target := filepath.Join(s.fixturesDir, "cases", "filtering")
+	target := filepath.Join(s.casesDir, "filtering")
 	report, exitCode := s.runFremenJSON(target, "--recursive", "--include-node-modules")
 	s.Equal(1, exitCode)
 	s.GreaterOrEqual(len(report.Results), 2)
 }
 
 func (s *FremenTestSuite) Test_Filtering_ExcludeRegex() {
-	target := filepath.Join(s.fixturesDir, "cases", "filtering")
+	target := filepath.Join(s.casesDir, "filtering")
 	report, exitCode := s.runFremenJSON(target, "--recursive", "--exclude", "custom_exclude")
 
 	s.Equal(1, exitCode)
@@ -1,7 +1,9 @@
 package tests
 
 import (
+	"bytes"
 	"encoding/json"
+	"os"
 	"os/exec"
 	"strings"
 
@@ -12,10 +14,25 @@ type FremenTestSuite struct {
 	suite.Suite
 	binaryPath   string
 	fixturesDir  string
+	casesDir     string
 	databasePath string
+	dbArgs       []string
+	runCache     map[string]cachedRun
 }
 
-func (s *FremenTestSuite) runFremen(args ...string) (string, int) {
+// cachedRun memoizes one binary invocation so tests that exercise the same
+// target with the same arguments (e.g. the --no-color assertions) share a
+// single spawn. The key includes NO_COLOR, the one inherited environment
+// variable the output depends on.
+type cachedRun struct {
+	stdout   []byte
+	exitCode int
+}
+
+// runFremenRaw executes the binary and returns its stdout as raw bytes, so
+// callers that decode JSON do not pay for a bytes-to-string-to-bytes round
+// trip over potentially large reports.
+func (s *FremenTestSuite) runFremenRaw(args ...string) ([]byte, int) {
 	s.T().Helper()
 	hasDb := false
 	for _, arg := range args {
@@ -27,11 +44,22 @@ func (s *FremenTestSuite) runFremen(args ...string) (string, int) {
 
 	finalArgs := args
 	if !hasDb {
-		finalArgs = append(finalArgs, "--database", s.databasePath)
+		finalArgs = append(finalArgs, s.dbArgs...)
+	}
+
+	key := strings.Join(finalArgs, "\x00") + "\x00" + os.Getenv("NO_COLOR")
+	if cached, ok := s.runCache[key]; ok {
+		return cached.stdout, cached.exitCode
 	}
 
+	// Full reports run to tens of KiB; pre-sizing the capture buffer avoids
+	// the repeated grow-and-copy cycles of an empty one.
+	var stdout bytes.Buffer
+	stdout.Grow(64 << 10)
+
 	cmd := exec.Command(s.binaryPath, finalArgs...)
-	output, err := cmd.Output()
+	cmd.Stdout = &stdout
+	err := cmd.Run()
 	exitCode := 0
 	if err != nil {
 		if exitErr, ok := err.(*exec.ExitError); ok {
@@ -40,16 +68,23 @@ func (s *FremenTestSuite) runFremen(args ...string) (string, int) {
 			exitCode = -1
 		}
 	}
+	s.runCache[key] = cachedRun{stdout: stdout.Bytes(), exitCode: exitCode}
+	return stdout.Bytes(), exitCode
+}
+
+func (s *FremenTestSuite) runFremen(args ...string) (string, int) {
+	s.T().Helper()
+	output, exitCode := s.runFremenRaw(args...)
 	return string(output), exitCode
 }
 
 func (s *FremenTestSuite) runFremenJSON(args ...string) (Report, int) {
 	s.T().Helper()
 	args = append(args, "--json")
-	output, exitCode := s.runFremen(args...)
+	output, exitCode := s.runFremenRaw(args...)
 
 	var report Report
-	err := json.Unmarshal([]byte(output), &report)
+	err := json.Unmarshal(output, &report)
 	s.Require().NoError(err, "Failed to unmarshal JSON output: %s", output)
 
 	return report, exitCode
@@ -34,22 +34,25 @@ func (s *FremenTestSuite) SetupSuite() {
 	s.Require().NoError(err, "Failed to build fremen: %s", string(output))
 
 	s.fixturesDir = filepath.Join(testsDir, "fixtures")
+	s.casesDir = filepath.Join(s.fixturesDir, "cases")
 
-	dotGitPath := filepath.Join(s.fixturesDir, "cases", "filtering", "dot_git")
-	gitPath := filepath.Join(s.fixturesDir, "cases", "filtering", ".git")
+	dotGitPath := filepath.Join(s.casesDir, "filtering", "dot_git")
+	gitPath := filepath.Join(s.casesDir, "filtering", ".git")
 	if _, err := os.Stat(dotGitPath); err == nil {
 		err = os.Rename(dotGitPath, gitPath)
 		s.Require().NoError(err)
 	}
 
 	s.databasePath = filepath.Join(s.fixturesDir, "database.txt")
+	s.dbArgs = []string{"--database", s.databasePath}
+	s.runCache = make(map[string]cachedRun)
 }
 
 func (s *FremenTestSuite) TearDownSuite() {
 	_ = os.Remove(s.binaryPath)
 
-	gitPath := filepath.Join(s.fixturesDir, "cases", "filtering", ".git")
-	dotGitPath := filepath.Join(s.fixturesDir, "cases", "filtering", "dot_git")
+	gitPath := filepath.Join(s.casesDir, "filtering", ".git")
+	dotGitPath := filepath.Join(s.casesDir, "filtering", "dot_git")
 	if _, err := os.Stat(gitPath); err == nil {
 		_ = os.Rename(gitPath, dotGitPath)
 	}
@@ -5,7 +5,7 @@ import (
 )
 
 func (s *FremenTestSuite) Test_NPM_V1_Infected() {
-	target := filepath.Join(s.fixturesDir, "cases", "npm", "v1_infected")
+	target := filepath.Join(s.casesDir, "npm", "v1_infected")
 	report, exitCode := s.runFremenJSON(target)
 
 	s.Equal(1, exitCode)
@@ -41,7 +41,7 @@ func (s *FremenTestSuite) Test_NPM_V1_Infected() {
 }
 
 func (s *FremenTestSuite) Test_NPM_V1_Clean() {
-	target := filepath.Join(s.fixturesDir, "cases", "npm", "v1_clean")
+	target := filepath.Join(s.casesDir, "npm", "v1_clean")
 	report, exitCode := s.runFremenJSON(target)
 	s.Equal(0, exitCode)
 
@@ -67,7 +67,7 @@ func (s *FremenTestSuite) Test_NPM_V1_Clean() {
 }
 
 func (s *FremenTestSuite) Test_NPM_V2_Infected() {
-	target := filepath.Join(s.fixturesDir, "cases", "npm", "v2_infected")
+	target := filepath.Join(s.casesDir, "npm", "v2_infected")
 	report, exitCode := s.runFremenJSON(target)
 	s.Equal(1, exitCode)
 
@@ -77,14 +77,14 @@ func (s *FremenTestSuite) Test_NPM_V2_Infected() {
 }
 
 func (s *FremenTestSuite) Test_NPM_V2_Clean() {
-	target := filepath.Join(s.fixturesDir, "cases", "npm", "v2_clean")
+	target := filepath.Join(s.casesDir, "npm", "v2_clean")
 	report, exitCode := s.runFremenJSON(target)
 	s.Equal(0, exitCode)
 	s.Equal(0, report.Summary.InfectedProjects)
 }
 
 func (s *FremenTestSuite) Test_NPM_Empty() {
-	target := filepath.Join(s.fixturesDir, "cases", "npm", "empty")
+	target := filepath.Join(s.casesDir, "npm", "empty")
 	report, exitCode := s.runFremenJSON(target)
 	s.Equal(1, exitCode)
 	s.Equal(0, report.Summary.TotalProjects)
@@ -92,13 +92,13 @@ func (s *FremenTestSuite) Test_NPM_Empty() {
 }
 
 func (s *FremenTestSuite) Test_NPM_Malformed() {
-	target := filepath.Join(s.fixturesDir, "cases", "npm", "malformed")
+	target := filepath.Join(s.casesDir, "npm", "malformed")
 	_, exitCode := s.runFremenJSON(target)
 	s.Equal(1, exitCode)
 }
 
 func (s *FremenTestSuite) Test_NPM_Recursive() {
-	target := filepath.Join(s.fixturesDir, "cases", "npm", "recursive")
+	target := filepath.Join(s.casesDir, "npm", "recursive")
 	report, exitCode := s.runFremenJSON(target, "--recursive")
 	s.Equal(1, exitCode)
 	s.GreaterOrEqual(report.Summary.InfectedProjects, 1)
@@ -6,7 +6,7 @@ import (
 )
 
 func (s *FremenTestSuite) Test_Print_Default() {
-	target := filepath.Join(s.fixturesDir, "cases", "npm", "v1_infected")
+	target := filepath.Join(s.casesDir, "npm", "v1_infected")
 	output, exitCode := s.runFremen(target)
 	s.Equal(1, exitCode)
 	s.Contains(output, "\x1b[")
@@ -14,7 +14,7 @@ func (s *FremenTestSuite) Test_Print_Default() {
 }
 
 func (s *FremenTestSuite) Test_Print_Infected() {
-	target := filepath.Join(s.fixturesDir, "cases", "npm", "v1_infected")
+	target := filepath.Join(s.casesDir, "npm", "v1_infected")
 	output, exitCode := s.runFremen(target, "--no-color")
 	s.Equal(1, exitCode)
 
@@ -51,7 +51,7 @@ Total Issues:   1
 }
 
 func (s *FremenTestSuite) Test_Print_Clean() {
-	target := filepath.Join(s.fixturesDir, "cases", "npm", "v1_clean")
+	target := filepath.Join(s.casesDir, "npm", "v1_clean")
 	output, exitCode := s.runFremen(target, "--no-color")
 	s.Equal(0, exitCode)
 
@@ -83,7 +83,7 @@ Total Issues:   0
 }
 
 func (s *FremenTestSuite) Test_Print_Clean_FullReport() {
-	target := filepath.Join(s.fixturesDir, "cases", "npm", "v1_clean")
+	target := filepath.Join(s.casesDir, "npm", "v1_clean")
 	output, exitCode := s.runFremen(target, "--no-color", "--full-report")
 	s.Equal(0, exitCode)
 
@@ -117,7 +117,7 @@ Total Issues:   0
 }
 
 func (s *FremenTestSuite) Test_Print_NoLockfile() {
-	target := filepath.Join(s.fixturesDir, "cases", "edges", "no_lockfiles")
+	target := filepath.Join(s.casesDir, "edges", "no_lockfiles")
 	output, exitCode := s.runFremen(target, "--no-color")
 	s.Equal(1, exitCode)
 
@@ -149,13 +149,13 @@ Total Issues:   0
 }
 
 func (s *FremenTestSuite) Test_Print_NoColor() {
-	target := filepath.Join(s.fixturesDir, "cases", "npm", "v1_infected")
+	target := filepath.Join(s.casesDir, "npm", "v1_infected")
 	output, _ := s.runFremen(target, "--no-color")
 	s.NotContains(output, "\x1b[")
 }
 
 func (s *FremenTestSuite) Test_Print_NoColorEnv() {
-	target := filepath.Join(s.fixturesDir, "cases", "npm", "v1_infected")
+	target := filepath.Join(s.casesDir, "npm", "v1_infected")
 
 	s.T().Setenv("NO_COLOR", "1")
 	output, _ := s.runFremen(target)
@@ -163,7 +163,7 @@ func (s *FremenTestSuite) Test_Print_NoColorEnv() {
 }
 
 func (s *FremenTestSuite) Test_Print_NoEmoji() {
-	target := filepath.Join(s.fixturesDir, "cases", "npm", "v1_infected")
+	target := filepath.Join(s.casesDir, "npm", "v1_infected")
 	output, _ := s.runFremen(target, "--no-emoji")
 	s.NotContains(output, "🚫")
 }